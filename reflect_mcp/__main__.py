@@ -3,6 +3,8 @@
 
 import sys
 import os
+import argparse
+import asyncio
 import traceback
 
 # Only show debug output if MCP_DEBUG is set
@@ -12,13 +14,55 @@ if os.getenv("MCP_DEBUG"):
     print(f"CWD: {os.getcwd()}", file=sys.stderr)
     print(f"Args: {sys.argv}", file=sys.stderr)
 
-from .server import main as server_main
+from .server import main as server_main, get_default_graph
+from .client import ReflectClient
+from .config import config
+from .importer import run_import
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments; no subcommand runs the MCP server."""
+    parser = argparse.ArgumentParser(prog="reflect-mcp", description="Reflect Notes MCP server")
+    subparsers = parser.add_subparsers(dest="command")
+
+    import_parser = subparsers.add_parser(
+        "import",
+        help="Import a directory of Markdown notes, or a CSV/JSONL file of links or notes"
+    )
+    import_parser.add_argument("source", help="Directory, .csv or .jsonl file to import")
+    import_parser.add_argument("--graph-id", help="Graph ID (uses default if not provided)")
+    import_parser.add_argument("--checkpoint", help="Checkpoint file (defaults to next to the source)")
+    import_parser.add_argument("--concurrency", type=int, default=4, help="Maximum uploads in flight")
+
+    return parser.parse_args(argv)
+
+
+async def import_command(args: argparse.Namespace):
+    """Run a bulk import from the command line."""
+    if not config.access_token:
+        raise ValueError("REFLECT_ACCESS_TOKEN must be set to import")
+
+    graph_id = args.graph_id or await get_default_graph()
+    if not graph_id:
+        raise ValueError("No --graph-id provided and no default graph configured")
+
+    def report(stats):
+        if stats["uploaded"] % 100 == 0:
+            print(f"Uploaded {stats['uploaded']} records...", file=sys.stderr)
+
+    async with ReflectClient() as client:
+        stats = await run_import(client, graph_id, args.source, args.checkpoint, args.concurrency, report)
+    print(f"Import complete: {stats['uploaded']} uploaded, {stats['skipped']} already imported", file=sys.stderr)
 
 
 def main():
-    """Run the MCP server."""
+    """Run the MCP server, or a CLI subcommand."""
+    args = parse_args()
     try:
-        server_main()
+        if args.command == "import":
+            asyncio.run(import_command(args))
+        else:
+            server_main()
     except KeyboardInterrupt:
         sys.exit(0)
     except Exception as e:
@@ -28,4 +72,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
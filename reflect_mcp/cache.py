@@ -0,0 +1,114 @@
+"""In-memory cache of Reflect list results shared across client instances."""
+
+import re
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+
+
+class CollectionCache:
+    """Cached items for one graph collection, in the order the API returned them."""
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self.by_id: Dict[str, Any] = {}
+        self.fetched_at: Optional[float] = None
+        # Validators and decoded size of the last full response
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.body_size = 0
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether a full list fetch happened within the last `ttl` seconds."""
+        if self.fetched_at is None:
+            return False
+        return time.monotonic() - self.fetched_at < ttl
+
+    def replace(
+        self,
+        items: Iterable[Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        body_size: int = 0
+    ):
+        """Replace the cached collection with a freshly fetched list."""
+        self.items = list(items)
+        self.by_id = {item.id: item for item in self.items}
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body_size = body_size
+        self.fetched_at = time.monotonic()
+
+    def revalidated(self):
+        """Mark the cached collection current after a 304 Not Modified."""
+        self.fetched_at = time.monotonic()
+
+    def invalidate(self):
+        """Force the next read to go upstream (validators are kept for revalidation)."""
+        self.fetched_at = None
+
+    def upsert(self, item: Any):
+        """Insert or replace a single item, keeping the list's updated_at direction."""
+        existing = self.by_id.get(item.id)
+        if existing is not None:
+            self.items.remove(existing)
+
+        key = _sort_key(item)
+        newest_first = self._newest_first()
+        index = 0
+        while index < len(self.items):
+            other = _sort_key(self.items[index])
+            if (other <= key) if newest_first else (other > key):
+                break
+            index += 1
+        self.items.insert(index, item)
+        self.by_id[item.id] = item
+
+    def _newest_first(self) -> bool:
+        """Infer the API's order from the first and last timestamps (newest first on a tie)."""
+        if not self.items:
+            return True
+        first, last = _sort_key(self.items[0]), _sort_key(self.items[-1])
+        if _MISSING in (first, last):
+            return True
+        return first >= last
+
+
+# Items without a parseable updated_at sort as the oldest
+_MISSING = datetime.min.replace(tzinfo=timezone.utc)
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+def _sort_key(item: Any) -> datetime:
+    value = getattr(item, "updated_at", None)
+    if not value:
+        return _MISSING
+    # fromisoformat only accepts "Z" and 3/6-digit fractions from Python 3.11
+    value = _FRACTION.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), value.replace("Z", "+00:00"), count=1)
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return _MISSING
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class ReflectCache:
+    """Per-graph collections of links and books."""
+
+    def __init__(self):
+        self._collections: Dict[Tuple[str, str], CollectionCache] = {}
+
+    def collection(self, graph_id: str, kind: str) -> CollectionCache:
+        """Get (or create) the cached collection of `kind` for a graph."""
+        key = (graph_id, kind)
+        if key not in self._collections:
+            self._collections[key] = CollectionCache()
+        return self._collections[key]
+
+    def clear(self):
+        """Drop all cached collections (e.g. after switching accounts)."""
+        self._collections.clear()
+
+
+# Global cache instance
+cache = ReflectCache()
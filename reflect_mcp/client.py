@@ -3,13 +3,19 @@
 import httpx
 from typing import Optional, Dict, Any, List
 from authlib.integrations.httpx_client import AsyncOAuth2Client
+from .cache import cache
 from .config import config
+from .metrics import metrics
 from .models import (
     Graph, Book, Link, CreateNoteResponse, AppendDailyNoteResponse, User,
     CreateLinkRequest, CreateNoteRequest, AppendDailyNoteRequest
 )
 
 
+# Minimum seconds between list revalidations triggered by id lookup misses
+MISS_REFRESH_INTERVAL = 5.0
+
+
 class ReflectClient:
     """Async client for Reflect API with OAuth2 authentication."""
     
@@ -81,16 +87,63 @@ class ReflectClient:
         
         return token
     
-    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
-        """Make authenticated request to Reflect API."""
+    async def _request(
+        self, method: str, endpoint: str, allow_not_modified: bool = False, **kwargs
+    ) -> httpx.Response:
+        """Make authenticated request to Reflect API (`allow_not_modified` for conditional GETs)."""
         if not self._client:
             raise RuntimeError("Client not initialized. Use 'async with ReflectClient() as client:'")
         
         url = f"{self.base_url}{endpoint}"
         response = await self._client.request(method, url, **kwargs)
-        response.raise_for_status()
+        # httpx treats every non-2xx as an error, including a 304 that answers
+        # a conditional GET; anywhere else a 304 is unexpected and should raise
+        if not (allow_not_modified and response.status_code == httpx.codes.NOT_MODIFIED):
+            response.raise_for_status()
+        metrics.record_response(response.num_bytes_downloaded, len(response.content))
         return response
     
+    async def _list_collection(self, graph_id: str, kind: str, model, refresh: bool) -> List[Any]:
+        """Get a graph collection, revalidating the cached copy with its ETag/Last-Modified."""
+        entry = cache.collection(graph_id, kind)
+        if not refresh and entry.is_fresh(config.cache_ttl):
+            return list(entry.items)
+        
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        
+        response = await self._request(
+            "GET", f"/graphs/{graph_id}/{kind}", allow_not_modified=bool(headers), headers=headers
+        )
+        if response.status_code == 304:
+            metrics.record_not_modified(entry.body_size)
+            entry.revalidated()
+            return list(entry.items)
+        
+        data = response.json()
+        # API returns array directly
+        entry.replace(
+            (model(**item) for item in data),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            body_size=len(response.content)
+        )
+        return list(entry.items)
+    
+    async def _lookup(self, graph_id: str, kind: str, ids: List[str], fetch) -> List[Optional[Any]]:
+        """Serve ids from the cached index, revalidating the list once when stale or on a miss."""
+        entry = cache.collection(graph_id, kind)
+        missing = any(item_id not in entry.by_id for item_id in ids)
+        # Misses revalidate (usually a cheap 304) at most once per interval, so
+        # repeated lookups of a deleted id don't refetch on every call
+        if not entry.is_fresh(config.cache_ttl) or (missing and not entry.is_fresh(MISS_REFRESH_INTERVAL)):
+            await fetch(graph_id, refresh=True)
+            entry = cache.collection(graph_id, kind)
+        return [entry.by_id.get(item_id) for item_id in ids]
+    
     # Graph operations
     async def list_graphs(self) -> List[Graph]:
         """Get all graphs."""
@@ -100,29 +153,36 @@ class ReflectClient:
         return [Graph(**graph) for graph in data]
     
     # Book operations
-    async def list_books(self, graph_id: str) -> List[Book]:
-        """Get all books for a graph."""
-        response = await self._request("GET", f"/graphs/{graph_id}/books")
-        data = response.json()
-        # API returns array directly
-        return [Book(**book) for book in data]
+    async def list_books(self, graph_id: str, refresh: bool = False) -> List[Book]:
+        """Get all books for a graph (served from cache unless stale or `refresh`)."""
+        return await self._list_collection(graph_id, "books", Book, refresh)
+    
+    async def get_books(self, graph_id: str, book_ids: List[str]) -> List[Optional[Book]]:
+        """Look up books by id, in order; unknown ids map to None."""
+        return await self._lookup(graph_id, "books", book_ids, self.list_books)
     
     # Link operations
-    async def list_links(self, graph_id: str) -> List[Link]:
-        """Get all links for a graph."""
-        response = await self._request("GET", f"/graphs/{graph_id}/links")
-        data = response.json()
-        # API returns array directly
-        return [Link(**link) for link in data]
+    async def list_links(self, graph_id: str, refresh: bool = False) -> List[Link]:
+        """Get all links for a graph (served from cache unless stale or `refresh`)."""
+        return await self._list_collection(graph_id, "links", Link, refresh)
+    
+    async def get_links(self, graph_id: str, link_ids: List[str]) -> List[Optional[Link]]:
+        """Look up links by id, in order; unknown ids map to None."""
+        return await self._lookup(graph_id, "links", link_ids, self.list_links)
     
-    async def create_link(self, graph_id: str, link_data: CreateLinkRequest) -> Link:
-        """Create a new link."""
+    async def create_link(self, graph_id: str, link_data: CreateLinkRequest, write_through: bool = True) -> Link:
+        """Create a new link (pass write_through=False for bulk uploads and invalidate once)."""
         response = await self._request(
             "POST",
             f"/graphs/{graph_id}/links",
             json=link_data.model_dump(exclude_none=True)
         )
-        return Link(**response.json())
+        link = Link(**response.json())
+        # Write through so a fetched list includes the new link without a refetch
+        entry = cache.collection(graph_id, "links")
+        if write_through and entry.fetched_at is not None:
+            entry.upsert(link)
+        return link
     
     # Note operations
     async def create_note(self, graph_id: str, note_data: CreateNoteRequest) -> CreateNoteResponse:
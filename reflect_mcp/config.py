@@ -40,6 +40,10 @@ class ReflectConfig(BaseModel):
         default_factory=lambda: os.getenv("REFLECT_DEFAULT_GRAPH_ID"),
         description="Default graph ID to use for operations"
     )
+    cache_ttl: float = Field(
+        default_factory=lambda: float(os.getenv("REFLECT_CACHE_TTL", "60")),
+        description="Seconds a fetched list of links or books is served from cache"
+    )
 
     class Config:
         env_prefix = "REFLECT_"
@@ -0,0 +1,255 @@
+"""Streaming bulk import of notes and links into Reflect."""
+
+import asyncio
+import csv
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional, Dict, Iterator, Set, Union, Callable
+from .cache import cache
+from .client import ReflectClient
+from .models import CreateLinkRequest, CreateNoteRequest
+
+ImportRecord = Union[CreateNoteRequest, CreateLinkRequest]
+
+
+def iter_records(source: str) -> Iterator[ImportRecord]:
+    """
+    Lazily map an import source to create requests.
+
+    Supported sources:
+    - a directory of Markdown files (one note per file, subject from the
+      leading "# " heading or the file name)
+    - a CSV file with a `url` column and optional `title`, `description`
+      and `highlights` (one highlight per line) columns
+    - a JSONL file of link objects (with `url`) or note objects (with
+      `subject` and `content`/`content_markdown`)
+    """
+    path = Path(source)
+    if path.is_dir():
+        return _iter_markdown_dir(path)
+    if path.suffix.lower() == ".csv":
+        return _iter_csv(path)
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        return _iter_jsonl(path)
+    raise ValueError(f"Unsupported import source: {source} (expected a directory, .csv or .jsonl)")
+
+
+def _iter_markdown_paths(root: Path) -> Iterator[Path]:
+    # Sorted walk so record indexes are stable across resumed runs
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(".md"):
+                yield Path(dirpath) / filename
+
+
+def _iter_markdown_dir(root: Path) -> Iterator[ImportRecord]:
+    for path in _iter_markdown_paths(root):
+        text = path.read_text(encoding="utf-8")
+        first_line, _, rest = text.partition("\n")
+        if first_line.startswith("# "):
+            subject, content = first_line[2:].strip(), rest.lstrip("\n")
+        else:
+            subject, content = path.stem, text
+        yield CreateNoteRequest(subject=subject, content_markdown=content)
+
+
+def _iter_csv(path: Path) -> Iterator[ImportRecord]:
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if "url" not in (reader.fieldnames or []):
+            raise ValueError(f"{path}: missing url column (found: {', '.join(reader.fieldnames or []) or 'none'})")
+        for row in reader:
+            url = (row.get("url") or "").strip()
+            if not url:
+                raise ValueError(f"{path}:{reader.line_num}: missing url")
+            yield CreateLinkRequest(
+                url=url,
+                title=row.get("title") or None,
+                description=row.get("description") or None,
+                highlights=[h for h in (row.get("highlights") or "").splitlines() if h.strip()]
+            )
+
+
+def _iter_jsonl(path: Path) -> Iterator[ImportRecord]:
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                if "url" in data:
+                    yield CreateLinkRequest(**data)
+                else:
+                    if "content" in data and "content_markdown" not in data:
+                        data["content_markdown"] = data.pop("content")
+                    yield CreateNoteRequest(**data)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"{path}:{line_number}: invalid record: {e}") from e
+
+
+def source_fingerprint(source: str) -> str:
+    """
+    Hash identifying the exact records of a source.
+
+    Files are hashed by content; directories by the relative path, size and
+    modification time of each Markdown file, in import order.
+    """
+    path = Path(source)
+    digest = hashlib.sha256()
+    if path.is_dir():
+        for md_path in _iter_markdown_paths(path):
+            stat = md_path.stat()
+            digest.update(f"{md_path.relative_to(path).as_posix()}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    else:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def default_checkpoint_path(source: str) -> str:
+    """Checkpoint file placed next to the import source."""
+    return str(Path(source).resolve()) + ".reflect-import.json"
+
+
+class Checkpoint:
+    """
+    Import progress persisted after every upload.
+
+    Records are identified by their position in the source. `done` is the
+    number of leading records already uploaded; `completed` holds uploads
+    that finished out of order past that point. `run_import` never dispatches
+    more than `concurrency` records past `done`, so `completed` stays smaller
+    than the upload concurrency. Positions are only meaningful for an unchanged
+    source, so the checkpoint also stores the source fingerprint.
+    """
+
+    def __init__(self, path: str, source: str):
+        self.path = path
+        self.source = str(Path(source).resolve())
+        self.fingerprint = source_fingerprint(source)
+        self.done = 0
+        self.completed: Set[int] = set()
+
+    def load(self):
+        """Resume from an existing checkpoint file, if any."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("source") != self.source:
+            raise ValueError(f"Checkpoint {self.path} belongs to a different source: {data.get('source')}")
+        if data.get("fingerprint") != self.fingerprint:
+            raise ValueError(
+                f"{self.source} changed since checkpoint {self.path} was written; "
+                "resuming would skip or duplicate records. Delete the checkpoint to import from scratch."
+            )
+        self.done = data["done"]
+        self.completed = set(data.get("completed", []))
+
+    def is_done(self, index: int) -> bool:
+        """Whether the record at `index` was uploaded by a previous run."""
+        return index < self.done or index in self.completed
+
+    def mark(self, index: int):
+        """Record a finished upload and persist the checkpoint."""
+        self.completed.add(index)
+        while self.done in self.completed:
+            self.completed.remove(self.done)
+            self.done += 1
+        self.save()
+
+    def save(self):
+        """Atomically write the checkpoint file."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "source": self.source,
+                "fingerprint": self.fingerprint,
+                "done": self.done,
+                "completed": sorted(self.completed)
+            }, f)
+        os.replace(tmp_path, self.path)
+
+
+async def run_import(
+    client: ReflectClient,
+    graph_id: str,
+    source: str,
+    checkpoint_path: Optional[str] = None,
+    concurrency: int = 4,
+    on_progress: Optional[Callable[[Dict[str, int]], None]] = None
+) -> Dict[str, int]:
+    """
+    Upload every record of `source` to a graph, resuming from the checkpoint.
+
+    Records are dispatched only within `concurrency` positions of the first
+    unfinished one, so at most that many uploads are in flight. The source
+    is read one record at a time, so memory use does not depend on the
+    input size.
+    Uploads skip the per-link cache write-through; the graph's cached links
+    are invalidated once at the end instead. The first failed upload stops
+    the import once in-flight uploads finish; running it again retries from
+    that record.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    checkpoint = Checkpoint(checkpoint_path or default_checkpoint_path(source), source)
+    checkpoint.load()
+
+    stats = {"uploaded": 0, "skipped": 0}
+    # Signalled whenever an upload finishes, to slide the dispatch window
+    progress = asyncio.Condition()
+    tasks: Set[asyncio.Task] = set()
+    failure: Optional[tuple] = None
+
+    async def upload(index: int, record: ImportRecord):
+        nonlocal failure
+        try:
+            if isinstance(record, CreateLinkRequest):
+                await client.create_link(graph_id, record, write_through=False)
+            else:
+                await client.create_note(graph_id, record)
+        except Exception as e:
+            if failure is None:
+                failure = (index, e)
+        else:
+            checkpoint.mark(index)
+            stats["uploaded"] += 1
+            if on_progress:
+                on_progress(stats)
+        finally:
+            async with progress:
+                progress.notify_all()
+
+    try:
+        for index, record in enumerate(iter_records(source)):
+            if checkpoint.is_done(index):
+                stats["skipped"] += 1
+                continue
+            # Only dispatch within `concurrency` records of the first unfinished
+            # one: this bounds uploads in flight and the checkpoint's `completed`
+            # set, even when a slow record holds `done` back
+            async with progress:
+                await progress.wait_for(lambda: failure is not None or index < checkpoint.done + concurrency)
+            if failure is not None:
+                break
+            task = asyncio.create_task(upload(index, record))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        if tasks:
+            await asyncio.gather(*tasks)
+        if stats["uploaded"]:
+            cache.collection(graph_id, "links").invalidate()
+
+    if failure is not None:
+        index, error = failure
+        raise RuntimeError(f"Import stopped at record {index}: {error}") from error
+
+    stats["total"] = checkpoint.done
+    return stats
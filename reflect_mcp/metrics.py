@@ -0,0 +1,50 @@
+"""Transfer metrics for Reflect API requests."""
+
+from typing import Dict
+
+
+class TransferMetrics:
+    """Counts bytes moved over the wire and bytes saved by compression and revalidation."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Zero all counters."""
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.bytes_saved_revalidation = 0
+
+    def record_response(self, wire_bytes: int, decoded_bytes: int):
+        """Record a response body as transferred and after decompression."""
+        self.requests += 1
+        self.bytes_received += wire_bytes
+        self.bytes_decoded += decoded_bytes
+
+    def record_not_modified(self, cached_bytes: int):
+        """Record a 304 that let a cached body of `cached_bytes` be reused."""
+        self.not_modified += 1
+        self.bytes_saved_revalidation += cached_bytes
+
+    @property
+    def bytes_saved_compression(self) -> int:
+        """Decoded bytes that did not have to cross the wire."""
+        return max(self.bytes_decoded - self.bytes_received, 0)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Current counters, including derived savings."""
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "bytes_received": self.bytes_received,
+            "bytes_decoded": self.bytes_decoded,
+            "bytes_saved_compression": self.bytes_saved_compression,
+            "bytes_saved_revalidation": self.bytes_saved_revalidation,
+            "bytes_saved_total": self.bytes_saved_compression + self.bytes_saved_revalidation,
+        }
+
+
+# Global metrics instance
+metrics = TransferMetrics()
@@ -5,8 +5,11 @@ import webbrowser
 from typing import Optional, List, Dict, Any
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent
+from .cache import cache
 from .client import ReflectClient
 from .config import config
+from .importer import run_import
+from .metrics import metrics
 from .models import CreateLinkRequest, CreateNoteRequest, AppendDailyNoteRequest
 
 # Initialize FastMCP server
@@ -48,6 +51,7 @@ async def set_access_token(code: str) -> str:
     try:
         async with ReflectClient() as client:
             token = await client.fetch_token(code)
+            cache.clear()
             return f"Authentication successful! Access token saved. Token type: {token.get('token_type', 'Bearer')}"
     except Exception as e:
         return f"Error exchanging code for token: {str(e)}"
@@ -64,6 +68,7 @@ async def set_token_directly(access_token: str, refresh_token: Optional[str] = N
         refresh_token: Optional OAuth2 refresh token
     """
     config.access_token = access_token
+    cache.clear()
     if refresh_token:
         config.refresh_token = refresh_token
     return "Access token set successfully"
@@ -105,7 +110,8 @@ async def get_default_graph() -> Optional[str]:
 async def list_books(
     graph_id: Optional[str] = None, 
     limit: Optional[int] = 50,
-    offset: Optional[int] = 0
+    offset: Optional[int] = 0,
+    refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Get books for a specific graph with pagination.
@@ -114,6 +120,7 @@ async def list_books(
         graph_id: Graph ID (uses default if not provided)
         limit: Maximum number of books to return per page (default: 50)
         offset: Number of books to skip (default: 0)
+        refresh: Bypass the local cache and fetch from Reflect (default: False)
     """
     if not config.access_token:
         raise ValueError("Not authenticated. Use 'authenticate' tool first.")
@@ -124,7 +131,7 @@ async def list_books(
             raise ValueError("No graph_id provided and no default graph configured")
     
     async with ReflectClient() as client:
-        books = await client.list_books(graph_id)
+        books = await client.list_books(graph_id, refresh=refresh)
         total_books = len(books)
         
         # Apply pagination
@@ -148,7 +155,8 @@ async def list_books(
 async def list_links(
     graph_id: Optional[str] = None, 
     limit: Optional[int] = 50,
-    offset: Optional[int] = 0
+    offset: Optional[int] = 0,
+    refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Get links for a specific graph with pagination.
@@ -157,6 +165,7 @@ async def list_links(
         graph_id: Graph ID (uses default if not provided)
         limit: Maximum number of links to return per page (default: 50)
         offset: Number of links to skip (default: 0)
+        refresh: Bypass the local cache and fetch from Reflect (default: False)
     """
     if not config.access_token:
         raise ValueError("Not authenticated. Use 'authenticate' tool first.")
@@ -167,7 +176,7 @@ async def list_links(
             raise ValueError("No graph_id provided and no default graph configured")
     
     async with ReflectClient() as client:
-        links = await client.list_links(graph_id)
+        links = await client.list_links(graph_id, refresh=refresh)
         total_links = len(links)
         
         # Apply pagination
@@ -187,6 +196,62 @@ async def list_links(
         }
 
 
+@mcp.tool()
+async def get_book(
+    book_ids: List[str],
+    graph_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get one or more books by id without paging through list_books.
+    
+    Args:
+        book_ids: IDs of the books to fetch
+        graph_id: Graph ID (uses default if not provided)
+    """
+    if not config.access_token:
+        raise ValueError("Not authenticated. Use 'authenticate' tool first.")
+    
+    if not graph_id:
+        graph_id = await get_default_graph()
+        if not graph_id:
+            raise ValueError("No graph_id provided and no default graph configured")
+    
+    async with ReflectClient() as client:
+        found = await client.get_books(graph_id, book_ids)
+        return {
+            "books": [book.model_dump() for book in found if book is not None],
+            "missing": [book_id for book_id, book in zip(book_ids, found) if book is None]
+        }
+
+
+@mcp.tool()
+async def get_link(
+    link_ids: List[str],
+    graph_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get one or more links by id without paging through list_links.
+    
+    Args:
+        link_ids: IDs of the links to fetch
+        graph_id: Graph ID (uses default if not provided)
+    """
+    if not config.access_token:
+        raise ValueError("Not authenticated. Use 'authenticate' tool first.")
+    
+    if not graph_id:
+        graph_id = await get_default_graph()
+        if not graph_id:
+            raise ValueError("No graph_id provided and no default graph configured")
+    
+    async with ReflectClient() as client:
+        found = await client.get_links(graph_id, link_ids)
+        return {
+            "links": [link.model_dump() for link in found if link is not None],
+            "missing": [link_id for link_id, link in zip(link_ids, found) if link is None]
+        }
+
+
 @mcp.tool()
 async def create_link(
     url: str,
@@ -295,6 +360,36 @@ async def append_daily_note(
         return result.model_dump()
 
 
+@mcp.tool()
+async def bulk_import(
+    source: str,
+    graph_id: Optional[str] = None,
+    checkpoint: Optional[str] = None,
+    concurrency: int = 4
+) -> Dict[str, Any]:
+    """
+    Import notes or links from a local file or directory into Reflect.
+    Progress is checkpointed, so re-running an interrupted import resumes
+    without creating duplicates.
+    
+    Args:
+        source: Directory of Markdown files, CSV of links (url, title, description, highlights) or JSONL of notes/links
+        graph_id: Graph ID (uses default if not provided)
+        checkpoint: Checkpoint file path (defaults to next to the source)
+        concurrency: Maximum number of uploads in flight (default: 4)
+    """
+    if not config.access_token:
+        raise ValueError("Not authenticated. Use 'authenticate' tool first.")
+    
+    if not graph_id:
+        graph_id = await get_default_graph()
+        if not graph_id:
+            raise ValueError("No graph_id provided and no default graph configured")
+    
+    async with ReflectClient() as client:
+        return await run_import(client, graph_id, source, checkpoint, concurrency)
+
+
 @mcp.tool()
 async def get_current_user() -> Dict[str, Any]:
     """
@@ -335,6 +430,39 @@ async def get_config() -> str:
 - Redirect URI: {config.redirect_uri}"""
 
 
+@mcp.resource("reflect://metrics")
+async def get_metrics() -> str:
+    """Get API transfer metrics, including bytes saved by compression and revalidation."""
+    lines = [f"- {name}: {value}" for name, value in metrics.snapshot().items()]
+    return "Reflect API Transfer Metrics:\n" + "\n".join(lines)
+
+
+@mcp.resource("reflect://graphs/{graph_id}/links/{link_id}")
+async def get_link_resource(graph_id: str, link_id: str) -> str:
+    """Get a single link as JSON."""
+    if not config.access_token:
+        raise ValueError("Not authenticated. Use 'authenticate' tool first.")
+    
+    async with ReflectClient() as client:
+        [link] = await client.get_links(graph_id, [link_id])
+    if link is None:
+        raise ValueError(f"Link {link_id} not found in graph {graph_id}")
+    return link.model_dump_json()
+
+
+@mcp.resource("reflect://graphs/{graph_id}/books/{book_id}")
+async def get_book_resource(graph_id: str, book_id: str) -> str:
+    """Get a single book as JSON."""
+    if not config.access_token:
+        raise ValueError("Not authenticated. Use 'authenticate' tool first.")
+    
+    async with ReflectClient() as client:
+        [book] = await client.get_books(graph_id, [book_id])
+    if book is None:
+        raise ValueError(f"Book {book_id} not found in graph {graph_id}")
+    return book.model_dump_json()
+
+
 # Prompts for common workflows
 @mcp.prompt()
 async def create_reading_list() -> List[TextContent]:
@@ -0,0 +1,59 @@
+"""Shared fixtures: a mock Reflect API behind ReflectClient."""
+
+import functools
+import json
+import httpx
+import pytest
+from authlib.integrations.httpx_client import AsyncOAuth2Client
+from reflect_mcp import client as client_module
+from reflect_mcp.cache import cache
+from reflect_mcp.config import config
+from reflect_mcp.metrics import metrics
+
+
+class MockReflectAPI:
+    """Routes requests to handlers and records every request it receives."""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def route(self, method, path, handler):
+        self.routes[(method, path)] = handler
+
+    def count(self, method, path):
+        return sum(1 for r in self.requests if r.method == method and r.url.path == path)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        handler = self.routes.get((request.method, request.url.path))
+        if handler is None:
+            return httpx.Response(404)
+        return handler(request)
+
+
+def json_response(data, status_code=200, headers=None) -> httpx.Response:
+    return httpx.Response(status_code, content=json.dumps(data).encode(), headers={
+        "Content-Type": "application/json", **(headers or {})
+    })
+
+
+@pytest.fixture(autouse=True)
+def reset_state(monkeypatch):
+    cache.clear()
+    metrics.reset()
+    monkeypatch.setattr(config, "access_token", "test-token")
+    monkeypatch.setattr(config, "cache_ttl", 60.0)
+    yield
+    cache.clear()
+    metrics.reset()
+
+
+@pytest.fixture
+def api(monkeypatch) -> MockReflectAPI:
+    mock = MockReflectAPI()
+    transport = httpx.MockTransport(mock)
+    monkeypatch.setattr(
+        client_module, "AsyncOAuth2Client", functools.partial(AsyncOAuth2Client, transport=transport)
+    )
+    return mock
@@ -0,0 +1,130 @@
+"""Write-through consistency of the link cache against a mock API."""
+
+import asyncio
+from reflect_mcp.cache import cache
+from reflect_mcp.client import ReflectClient
+from reflect_mcp.models import CreateLinkRequest
+from .conftest import json_response
+
+LINKS_PATH = "/api/graphs/g1/links"
+
+EXISTING_LINKS = [
+    {"id": "l3", "url": "https://example.com/3", "updated_at": "2024-03-01T00:00:00Z"},
+    {"id": "l2", "url": "https://example.com/2", "updated_at": "2024-02-01T00:00:00Z"},
+    {"id": "l1", "url": "https://example.com/1", "updated_at": "2024-01-01T00:00:00Z"},
+]
+
+
+def _serve_links(api, created):
+    api.route("GET", LINKS_PATH, lambda request: json_response(EXISTING_LINKS))
+    api.route("POST", LINKS_PATH, lambda request: json_response(created))
+
+
+def test_list_after_create_makes_no_extra_requests(api):
+    created = {"id": "new", "url": "https://example.com/new", "updated_at": "2024-02-15T00:00:00Z"}
+    _serve_links(api, created)
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.list_links("g1")
+            await client.create_link("g1", CreateLinkRequest(url=created["url"]))
+            return await client.list_links("g1")
+
+    links = asyncio.run(scenario())
+
+    assert api.count("GET", LINKS_PATH) == 1
+    assert api.count("POST", LINKS_PATH) == 1
+    assert [link.id for link in links] == ["l3", "new", "l2", "l1"]
+    assert cache.collection("g1", "links").by_id["new"].url == created["url"]
+
+
+def test_create_replaces_cached_link_with_same_id(api):
+    updated = {"id": "l1", "url": "https://example.com/1", "title": "Edited", "updated_at": "2024-04-01T00:00:00Z"}
+    _serve_links(api, updated)
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.list_links("g1")
+            await client.create_link("g1", CreateLinkRequest(url=updated["url"], id="l1"))
+            return await client.list_links("g1")
+
+    links = asyncio.run(scenario())
+
+    assert [link.id for link in links] == ["l1", "l3", "l2"]
+    assert cache.collection("g1", "links").by_id["l1"].title == "Edited"
+
+
+def test_full_fetch_keeps_api_order(api):
+    unordered = [EXISTING_LINKS[2], EXISTING_LINKS[0], EXISTING_LINKS[1]]
+    api.route("GET", LINKS_PATH, lambda request: json_response(unordered))
+
+    async def scenario():
+        async with ReflectClient() as client:
+            return await client.list_links("g1")
+
+    links = asyncio.run(scenario())
+
+    assert [link.id for link in links] == ["l1", "l3", "l2"]
+
+
+def test_refresh_bypasses_cache(api):
+    _serve_links(api, {})
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.list_links("g1")
+            await client.list_links("g1", refresh=True)
+
+    asyncio.run(scenario())
+
+    assert api.count("GET", LINKS_PATH) == 2
+
+
+def test_create_before_any_list_does_not_populate_cache(api):
+    created = {"id": "new", "url": "https://example.com/new", "updated_at": "2024-02-15T00:00:00Z"}
+    _serve_links(api, created)
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.create_link("g1", CreateLinkRequest(url=created["url"]))
+
+    asyncio.run(scenario())
+
+    assert cache.collection("g1", "links").items == []
+
+
+def test_create_keeps_oldest_first_order(api):
+    oldest_first = list(reversed(EXISTING_LINKS))
+    created = {"id": "new", "url": "https://example.com/new", "updated_at": "2024-02-15T00:00:00Z"}
+    api.route("GET", LINKS_PATH, lambda request: json_response(oldest_first))
+    api.route("POST", LINKS_PATH, lambda request: json_response(created))
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.list_links("g1")
+            await client.create_link("g1", CreateLinkRequest(url=created["url"]))
+            return await client.list_links("g1")
+
+    links = asyncio.run(scenario())
+
+    assert [link.id for link in links] == ["l1", "l2", "new", "l3"]
+
+
+def test_create_compares_parsed_timestamps(api):
+    same_second = [
+        {"id": "a", "url": "https://example.com/a", "updated_at": "2024-01-01T00:00:00.750Z"},
+        {"id": "b", "url": "https://example.com/b", "updated_at": "2024-01-01T00:00:00Z"},
+    ]
+    created = {"id": "new", "url": "https://example.com/new", "updated_at": "2024-01-01T00:00:00.5Z"}
+    api.route("GET", LINKS_PATH, lambda request: json_response(same_second))
+    api.route("POST", LINKS_PATH, lambda request: json_response(created))
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.list_links("g1")
+            await client.create_link("g1", CreateLinkRequest(url=created["url"]))
+            return await client.list_links("g1")
+
+    links = asyncio.run(scenario())
+
+    assert [link.id for link in links] == ["a", "new", "b"]
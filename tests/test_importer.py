@@ -0,0 +1,236 @@
+"""Bulk importer: record mapping, bounded concurrency and resumable checkpoints."""
+
+import asyncio
+import json
+import pytest
+from reflect_mcp.cache import cache
+from reflect_mcp.client import ReflectClient
+from reflect_mcp.importer import Checkpoint, iter_records, run_import
+from reflect_mcp.models import CreateLinkRequest, CreateNoteRequest
+from .conftest import json_response
+
+
+class FakeClient:
+    """Records uploads, tracks in-flight requests and can fail given URLs once."""
+
+    def __init__(self, fail_urls=()):
+        self.fail_urls = set(fail_urls)
+        self.uploaded = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _upload(self, key, delay):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+            if key in self.fail_urls:
+                self.fail_urls.discard(key)
+                raise IOError(f"upload of {key} failed")
+            self.uploaded.append(key)
+        finally:
+            self.in_flight -= 1
+
+    async def create_link(self, graph_id, link_data, write_through=True):
+        # Later records finish first, so completions arrive out of order
+        number = int(link_data.url.rsplit("/", 1)[1])
+        await self._upload(link_data.url, 0.001 * (5 - number % 5))
+
+    async def create_note(self, graph_id, note_data):
+        await self._upload(note_data.subject, 0)
+
+
+def _write_csv(path, count):
+    lines = ["url,title,highlights"]
+    lines += [f'https://example.com/{i},Title {i},"first\nsecond"' for i in range(count)]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_csv_records(tmp_path):
+    source = tmp_path / "links.csv"
+    _write_csv(source, 2)
+
+    records = list(iter_records(str(source)))
+
+    assert records == [
+        CreateLinkRequest(url="https://example.com/0", title="Title 0", highlights=["first", "second"]),
+        CreateLinkRequest(url="https://example.com/1", title="Title 1", highlights=["first", "second"]),
+    ]
+
+
+def test_csv_without_url_column(tmp_path):
+    source = tmp_path / "links.csv"
+    source.write_text("URL,title\nhttps://example.com,Title\n")
+
+    with pytest.raises(ValueError, match="missing url column"):
+        list(iter_records(str(source)))
+
+
+def test_csv_blank_url_reports_line(tmp_path):
+    source = tmp_path / "links.csv"
+    source.write_text("url,title\nhttps://example.com,Title\n,,\n")
+
+    records = iter_records(str(source))
+
+    assert next(records).url == "https://example.com"
+    with pytest.raises(ValueError, match="links.csv:3: missing url"):
+        next(records)
+
+
+def test_jsonl_records(tmp_path):
+    source = tmp_path / "export.jsonl"
+    source.write_text(
+        json.dumps({"url": "https://example.com", "highlights": ["quote"]}) + "\n\n"
+        + json.dumps({"subject": "Note", "content": "Body", "pinned": True}) + "\n"
+    )
+
+    records = list(iter_records(str(source)))
+
+    assert records == [
+        CreateLinkRequest(url="https://example.com", highlights=["quote"]),
+        CreateNoteRequest(subject="Note", content_markdown="Body", pinned=True),
+    ]
+
+
+def test_jsonl_invalid_record_reports_line(tmp_path):
+    source = tmp_path / "export.jsonl"
+    source.write_text(json.dumps({"subject": "No content"}) + "\n")
+
+    with pytest.raises(ValueError, match="export.jsonl:1"):
+        list(iter_records(str(source)))
+
+
+def test_markdown_records(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "nested.md").write_text("No heading here")
+    (tmp_path / "a.md").write_text("# Heading\n\nBody text")
+    (tmp_path / "ignored.txt").write_text("not markdown")
+
+    records = list(iter_records(str(tmp_path)))
+
+    assert records == [
+        CreateNoteRequest(subject="Heading", content_markdown="Body text"),
+        CreateNoteRequest(subject="nested", content_markdown="No heading here"),
+    ]
+
+
+def test_unsupported_source(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported import source"):
+        iter_records(str(tmp_path / "links.xml"))
+
+
+def test_checkpoint_tracks_out_of_order_completions(tmp_path):
+    source = tmp_path / "links.csv"
+    _write_csv(source, 5)
+    checkpoint = Checkpoint(str(tmp_path / "checkpoint.json"), str(source))
+
+    checkpoint.mark(2)
+    checkpoint.mark(0)
+    assert (checkpoint.done, checkpoint.completed) == (1, {2})
+
+    checkpoint.mark(1)
+    assert (checkpoint.done, checkpoint.completed) == (3, set())
+
+    checkpoint.mark(4)
+    resumed = Checkpoint(checkpoint.path, str(source))
+    resumed.load()
+    assert [resumed.is_done(i) for i in range(5)] == [True, True, True, False, True]
+
+
+def test_concurrency_is_bounded(tmp_path):
+    source = tmp_path / "links.csv"
+    _write_csv(source, 40)
+    client = FakeClient()
+
+    stats = asyncio.run(run_import(client, "g1", str(source), concurrency=3))
+
+    assert stats == {"uploaded": 40, "skipped": 0, "total": 40}
+    assert client.max_in_flight == 3
+
+
+def test_slow_record_does_not_grow_completed(tmp_path, monkeypatch):
+    source = tmp_path / "links.csv"
+    _write_csv(source, 200)
+    largest = 0
+    original_mark = Checkpoint.mark
+
+    def tracking_mark(self, index):
+        nonlocal largest
+        original_mark(self, index)
+        largest = max(largest, len(self.completed))
+
+    monkeypatch.setattr(Checkpoint, "mark", tracking_mark)
+
+    class SlowHeadClient(FakeClient):
+        async def create_link(self, graph_id, link_data, write_through=True):
+            await self._upload(link_data.url, 0.2 if link_data.url.endswith("/0") else 0)
+
+    client = SlowHeadClient()
+    stats = asyncio.run(run_import(client, "g1", str(source), concurrency=4))
+
+    assert stats["uploaded"] == 200
+    assert largest < 4
+    assert client.max_in_flight <= 4
+
+
+def test_resume_after_failure_uploads_each_record_once(tmp_path):
+    source = tmp_path / "links.csv"
+    _write_csv(source, 30)
+    client = FakeClient(fail_urls={"https://example.com/12"})
+
+    with pytest.raises(RuntimeError, match="record 12"):
+        asyncio.run(run_import(client, "g1", str(source), concurrency=4))
+
+    saved = json.loads((tmp_path / "links.csv.reflect-import.json").read_text())
+    assert saved["done"] == 12
+    assert 0 < len(saved["completed"]) < 4
+
+    stats = asyncio.run(run_import(client, "g1", str(source), concurrency=4))
+
+    assert stats["uploaded"] + stats["skipped"] == 30
+    assert sorted(client.uploaded) == sorted(f"https://example.com/{i}" for i in range(30))
+
+
+def test_changed_source_refuses_to_resume(tmp_path):
+    source = tmp_path / "links.csv"
+    _write_csv(source, 5)
+    asyncio.run(run_import(FakeClient(), "g1", str(source)))
+
+    _write_csv(source, 6)
+
+    with pytest.raises(ValueError, match="changed since checkpoint"):
+        asyncio.run(run_import(FakeClient(), "g1", str(source)))
+
+
+def test_changed_markdown_directory_refuses_to_resume(tmp_path):
+    notes = tmp_path / "notes"
+    notes.mkdir()
+    (notes / "b.md").write_text("# B\n")
+    asyncio.run(run_import(FakeClient(), "g1", str(notes)))
+
+    (notes / "a.md").write_text("# A\n")
+
+    with pytest.raises(ValueError, match="changed since checkpoint"):
+        asyncio.run(run_import(FakeClient(), "g1", str(notes)))
+
+
+def test_import_invalidates_links_instead_of_writing_through(api, tmp_path):
+    links_path = "/api/graphs/g1/links"
+    api.route("GET", links_path, lambda request: json_response([]))
+    api.route("POST", links_path, lambda request: json_response({
+        "id": json.loads(request.content)["url"], "url": json.loads(request.content)["url"],
+        "updated_at": "2024-01-01T00:00:00Z"
+    }))
+    source = tmp_path / "links.csv"
+    _write_csv(source, 10)
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.list_links("g1")
+            await run_import(client, "g1", str(source))
+
+    asyncio.run(scenario())
+
+    entry = cache.collection("g1", "links")
+    assert entry.items == []
+    assert entry.fetched_at is None
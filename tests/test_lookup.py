@@ -0,0 +1,89 @@
+"""Id lookups served from the cached link/book index."""
+
+import asyncio
+from reflect_mcp import client as client_module
+from reflect_mcp.client import ReflectClient
+from reflect_mcp.config import config
+from .conftest import json_response
+
+LINKS_PATH = "/api/graphs/g1/links"
+BOOKS_PATH = "/api/graphs/g1/books"
+
+LINKS = [
+    {"id": "l2", "url": "https://example.com/2", "updated_at": "2024-02-01T00:00:00Z"},
+    {"id": "l1", "url": "https://example.com/1", "updated_at": "2024-01-01T00:00:00Z"},
+]
+BOOKS = [
+    {"id": "b1", "asin": "B000000001", "title": "First"},
+    {"id": "b2", "asin": "B000000002", "title": "Second"},
+]
+
+
+def test_batch_lookup_uses_one_fetch(api):
+    api.route("GET", LINKS_PATH, lambda request: json_response(LINKS))
+
+    async def scenario():
+        async with ReflectClient() as client:
+            first = await client.get_links("g1", ["l1", "l2"])
+            second = await client.get_links("g1", ["l2"])
+            return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert [link.id for link in first] == ["l1", "l2"]
+    assert [link.id for link in second] == ["l2"]
+    assert api.count("GET", LINKS_PATH) == 1
+
+
+def test_missing_id_revalidates_at_most_once_per_interval(api):
+    api.route("GET", BOOKS_PATH, lambda request: json_response(BOOKS))
+
+    async def scenario():
+        async with ReflectClient() as client:
+            results = []
+            for _ in range(3):
+                results.append(await client.get_books("g1", ["b1", "deleted"]))
+            return results
+
+    results = asyncio.run(scenario())
+
+    for found in results:
+        assert found[0].title == "First"
+        assert found[1] is None
+    assert api.count("GET", BOOKS_PATH) == 1
+
+
+def test_missing_id_revalidates_after_interval(api, monkeypatch):
+    books = list(BOOKS)
+    api.route("GET", BOOKS_PATH, lambda request: json_response(books))
+    monkeypatch.setattr(client_module, "MISS_REFRESH_INTERVAL", 0.0)
+
+    async def scenario():
+        async with ReflectClient() as client:
+            before = await client.get_books("g1", ["b3"])
+            # Created elsewhere (e.g. in the Reflect app) while the cache is fresh
+            books.append({"id": "b3", "asin": "B000000003", "title": "Third"})
+            after = await client.get_books("g1", ["b3"])
+            hit = await client.get_books("g1", ["b1"])
+            return before, after, hit
+
+    before, after, hit = asyncio.run(scenario())
+
+    assert before == [None]
+    assert after[0].title == "Third"
+    assert hit[0].title == "First"
+    assert api.count("GET", BOOKS_PATH) == 2
+
+
+def test_stale_collection_is_refetched(api, monkeypatch):
+    api.route("GET", LINKS_PATH, lambda request: json_response(LINKS))
+    monkeypatch.setattr(config, "cache_ttl", 0.0)
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.get_links("g1", ["l1"])
+            await client.get_links("g1", ["l1"])
+
+    asyncio.run(scenario())
+
+    assert api.count("GET", LINKS_PATH) == 2
@@ -0,0 +1,164 @@
+"""Conditional revalidation and compression of list endpoints against a mock API."""
+
+import asyncio
+import gzip
+import json
+import httpx
+import pytest
+from reflect_mcp.client import ReflectClient
+from reflect_mcp.config import config
+from reflect_mcp.metrics import metrics
+from reflect_mcp.models import CreateLinkRequest
+
+LINKS_PATH = "/api/graphs/g1/links"
+BOOKS_PATH = "/api/graphs/g1/books"
+
+LINKS = [
+    {"id": f"l{i}", "url": f"https://example.com/{i}", "title": "Saved article " * 10,
+     "updated_at": "2024-01-01T00:00:00Z"}
+    for i in range(20)
+]
+BOOKS = [{"id": "b1", "asin": "B000000001", "title": "First"}]
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+@pytest.fixture(autouse=True)
+def always_revalidate(monkeypatch):
+    # Every read goes upstream, so the validators decide what is transferred
+    monkeypatch.setattr(config, "cache_ttl", 0.0)
+
+
+def _etag_handler(body, etag='"v1"'):
+    def handler(request):
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json", "ETag": etag})
+    return handler
+
+
+def _last_modified_handler(body):
+    def handler(request):
+        if request.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=body, headers={"Content-Type": "application/json", "Last-Modified": LAST_MODIFIED}
+        )
+    return handler
+
+
+def _list_twice(method):
+    async def scenario():
+        async with ReflectClient() as client:
+            first = await getattr(client, method)("g1")
+            second = await getattr(client, method)("g1")
+            return first, second
+    return asyncio.run(scenario())
+
+
+def test_etag_round_trip(api):
+    body = json.dumps(LINKS).encode()
+    api.route("GET", LINKS_PATH, _etag_handler(body))
+
+    first, second = _list_twice("list_links")
+
+    requests = [r for r in api.requests if r.url.path == LINKS_PATH]
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert len(second) == len(LINKS)
+    assert all(a is b for a, b in zip(first, second))
+    assert metrics.not_modified == 1
+    assert metrics.bytes_saved_revalidation == len(body)
+
+
+def test_last_modified_round_trip(api):
+    body = json.dumps(BOOKS).encode()
+    api.route("GET", BOOKS_PATH, _last_modified_handler(body))
+
+    first, second = _list_twice("list_books")
+
+    requests = [r for r in api.requests if r.url.path == BOOKS_PATH]
+    assert requests[1].headers["If-Modified-Since"] == LAST_MODIFIED
+    assert second[0] is first[0]
+    assert metrics.bytes_saved_revalidation == len(body)
+
+
+def test_changed_etag_replaces_cached_objects(api):
+    versions = iter([json.dumps(LINKS[:1]).encode(), json.dumps(LINKS[:2]).encode()])
+
+    def handler(request):
+        # Server content changed between requests, so validators never match
+        return httpx.Response(200, content=next(versions), headers={"ETag": f'"{len(api.requests)}"'})
+
+    api.route("GET", LINKS_PATH, handler)
+
+    first, second = _list_twice("list_links")
+
+    assert [link.id for link in first] == ["l0"]
+    assert [link.id for link in second] == ["l0", "l1"]
+    assert metrics.not_modified == 0
+
+
+def test_lookup_after_revalidation(api):
+    api.route("GET", LINKS_PATH, _etag_handler(json.dumps(LINKS).encode()))
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.list_links("g1")
+            return await client.get_links("g1", ["l3", "missing"])
+
+    found = asyncio.run(scenario())
+
+    assert found[0].id == "l3"
+    assert found[1] is None
+    assert metrics.not_modified == 1
+
+
+def test_compressed_responses_are_measured(api):
+    body = json.dumps(LINKS).encode()
+    compressed = gzip.compress(body)
+
+    def handler(request):
+        assert "gzip" in request.headers["Accept-Encoding"]
+        # Streamed like a network response, so httpx counts the bytes on the wire
+        return httpx.Response(200, stream=httpx.ByteStream(compressed), headers={"Content-Encoding": "gzip"})
+
+    api.route("GET", LINKS_PATH, handler)
+
+    async def scenario():
+        async with ReflectClient() as client:
+            return await client.list_links("g1")
+
+    links = asyncio.run(scenario())
+
+    assert len(links) == len(LINKS)
+    snapshot = metrics.snapshot()
+    assert snapshot["bytes_received"] == len(compressed)
+    assert snapshot["bytes_decoded"] == len(body)
+    assert snapshot["bytes_saved_compression"] == len(body) - len(compressed)
+    assert snapshot["bytes_saved_total"] == len(body) - len(compressed)
+
+
+def test_errors_still_raise(api):
+    api.route("GET", LINKS_PATH, lambda request: httpx.Response(500))
+
+    async def scenario():
+        async with ReflectClient() as client:
+            await client.list_links("g1")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(scenario())
+
+
+def test_not_modified_outside_conditional_get_raises(api):
+    api.route("GET", LINKS_PATH, lambda request: httpx.Response(304))
+    api.route("POST", LINKS_PATH, lambda request: httpx.Response(304))
+
+    async def scenario(call):
+        async with ReflectClient() as client:
+            await call(client)
+
+    # No validators were sent, so a 304 is a server error, not a cache hit
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(scenario(lambda client: client.list_links("g1")))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(scenario(lambda client: client.create_link("g1", CreateLinkRequest(url="https://example.com"))))